@@ -6,10 +6,14 @@ Politics Watcher — flags when a known Republican is quoted with variants of:
 - Per-person Google News RSS + a pruned, resilient feed set
 - Optional feeds.txt (one URL per line) merged in
 - Follows article links and scans text for phrase variants
+- Feed + article fetches fan out over a bounded thread pool (per-host capped)
 - De-dupes via sqlite; emails on each new hit
 - Silent unless a match occurs
 - FORCE_TEST mode to send a test alert
 - Hardened fetch: retries, UA rotation, XML sanity, bad-feed muting
+- Keep-alive HTTP: connections are pooled per host and reused across fetches
+- Conditional GET for feeds (ETag / Last-Modified); a 304 reuses the cached body
+- gzip/deflate transfer; article pages must be HTML and are read up to MAX_PAGE_KB
 
 Env (Actions secrets or local env):
   SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, EMAIL_FROM, EMAIL_TO
@@ -21,11 +25,18 @@ Optional env:
   TIMEOUT=20             -> per HTTP request (seconds)
   FAIL_THRESHOLD=3       -> consecutive failures before muting a feed
   MUTE_HOURS=24          -> mute duration for noisy feeds
+  WORKERS=16             -> concurrent HTTP fetches (threads block on I/O, not the GIL)
+  PER_HOST=2             -> concurrent fetches against any single host
+  MAX_PAGE_KB=512        -> cap on (decompressed) bytes read per article page (<=0: no cap)
 """
 
-import os, re, sys, time, json, sqlite3, hashlib, html, urllib.request, xml.etree.ElementTree as ET
-from urllib.parse import quote, urlparse
+import os, io, re, sys, time, json, zlib, base64, sqlite3, hashlib, html, threading, http.client, xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, unquote, urljoin, urlparse, urlsplit
+from urllib.request import getproxies, proxy_bypass
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 DB = "pol_watch.db"
 OUT_DIR = "out"
@@ -34,6 +45,11 @@ TIMEOUT        = int(os.environ.get("TIMEOUT", "20"))
 MAX_LINKS      = int(os.environ.get("MAX_LINKS", "120"))
 FAIL_THRESHOLD = int(os.environ.get("FAIL_THRESHOLD", "3"))
 MUTE_HOURS     = int(os.environ.get("MUTE_HOURS", "24"))
+SEEN_DAYS      = 30   # fingerprints older than this are re-checked
+WORKERS        = max(1, int(os.environ.get("WORKERS", "16")))
+PER_HOST       = max(1, int(os.environ.get("PER_HOST", "2")))  # 0 would deadlock the host semaphores
+MAX_PAGE_BYTES = max(0, int(os.environ.get("MAX_PAGE_KB", "512"))) * 1024 or None  # <=0 -> uncapped
+HTML_TYPES     = ("text/html", "application/xhtml+xml")
 
 UA_STRINGS = [
     "PoliticsWatcher/1.4 (+https://github.com/)",
@@ -49,6 +65,26 @@ PHRASE_RE = re.compile(
     """,
     re.IGNORECASE | re.VERBOSE
 )
+# Literal every PHRASE_RE match must contain; checked on raw bytes before stripping.
+# ("not racist" alone is too strict: raw HTML may split it with &nbsp;, newlines, tags.)
+PHRASE_HINT = b"racist"
+_RE_HINT = re.compile("racist", re.I)
+# Pass 1 only downloads search-feed articles whose headline reads like a quote
+# (single quotes left out: they double as apostrophes, e.g. "Cruz's")
+QUOTE_CUES = ("said", "says", "told", "quote", "posted", "tweet", "remark", "racist",
+              '"', "\u201c", "\u201d")
+
+def find_phrase(text: str):
+    """PHRASE_RE.search, run only in a window around each "racist" in the text.
+
+    strip_html collapses whitespace, so a match starts at most len("i am not ") chars
+    before the literal; the tail allows a generous run of punctuation before "but".
+    """
+    for h in _RE_HINT.finditer(text):
+        m = PHRASE_RE.search(text, max(0, h.start() - 16), h.end() + 64)
+        if m:
+            return m
+    return None
 
 def google_news_rss(query: str) -> str:
     return f"https://news.google.com/rss/search?q={quote(query)}&hl=en-US&gl=US&ceid=US:en"
@@ -101,8 +137,34 @@ def load_names(path="republicans.txt"):
     with open(path, "r", encoding="utf-8") as f:
         return [ln.strip() for ln in f if ln.strip() and not ln.strip().startswith("#")]
 
-def ensure_db():
+_RE_WORD = re.compile(r"\w+")
+
+def build_name_index(people):
+    """Map each name's first word (lowercased) -> [(name, name_words)]."""
+    index = {}
+    for p in people:
+        words = tuple(_RE_WORD.findall(p.lower()))
+        if words:
+            index.setdefault(words[0], []).append((p, words))
+    return index
+
+def title_mentions(title: str, index) -> list:
+    """Names whose words appear as a whole-word run in title; one dict probe per title word."""
+    words = _RE_WORD.findall(title.lower())
+    found = {}
+    for i, w in enumerate(words):
+        for p, nw in index.get(w, ()):
+            if tuple(words[i:i + len(nw)]) == nw:
+                found[p] = None
+    return list(found)
+
+def ensure_db() -> sqlite3.Connection:
+    """Open the run's single DB connection (WAL) and make sure tables exist."""
     con = sqlite3.connect(DB)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.execute("PRAGMA temp_store=MEMORY")
+    con.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
     cur = con.cursor()
     cur.execute("""CREATE TABLE IF NOT EXISTS hits(
         id TEXT PRIMARY KEY,
@@ -113,6 +175,7 @@ def ensure_db():
         feed TEXT,
         snippet TEXT
     )""")
+    cur.execute("CREATE INDEX IF NOT EXISTS hits_person_url ON hits(person, url)")
     cur.execute("""CREATE TABLE IF NOT EXISTS seen(
         fp TEXT PRIMARY KEY,
         ts INTEGER
@@ -122,35 +185,39 @@ def ensure_db():
         fail_count INTEGER DEFAULT 0,
         muted_until INTEGER DEFAULT 0
     )""")
-    con.commit(); con.close()
+    cur.execute("""CREATE TABLE IF NOT EXISTS feed_cache(
+        url TEXT PRIMARY KEY,
+        etag TEXT,
+        last_modified TEXT,
+        body BLOB
+    )""")
+    con.commit()
+    return con
 
 def fp(*parts) -> str:
-    h = hashlib.sha256()
+    # Non-cryptographic dedupe key: blake2b sized to the 28-hex-char key directly
+    h = hashlib.blake2b(digest_size=14)
     for p in parts:
         h.update((p or "").encode("utf-8")); h.update(b"|")
-    return h.hexdigest()[:28]
+    return h.hexdigest()
 
 def host(u: str) -> str:
     try: return urlparse(u).netloc
     except: return ""
 
-def is_muted(feed: str) -> bool:
-    con = sqlite3.connect(DB); cur = con.cursor()
-    cur.execute("SELECT muted_until FROM feed_failures WHERE feed=?", (feed,))
-    row = cur.fetchone(); con.close()
+def is_muted(con, feed: str) -> bool:
+    row = con.execute("SELECT muted_until FROM feed_failures WHERE feed=?", (feed,)).fetchone()
     if not row: return False
     return int(time.time()) < (row[0] or 0)
 
-def note_success(feed: str):
-    con = sqlite3.connect(DB); cur = con.cursor()
-    cur.execute("""INSERT INTO feed_failures(feed, fail_count, muted_until)
+def note_success(con, feed: str):
+    con.execute("""INSERT INTO feed_failures(feed, fail_count, muted_until)
                    VALUES(?, 0, 0)
                    ON CONFLICT(feed) DO UPDATE SET fail_count=0, muted_until=0""", (feed,))
-    con.commit(); con.close()
 
-def note_failure(feed: str):
+def note_failure(con, feed: str):
     now = int(time.time())
-    con = sqlite3.connect(DB); cur = con.cursor()
+    cur = con.cursor()
     cur.execute("SELECT fail_count FROM feed_failures WHERE feed=?", (feed,))
     row = cur.fetchone()
     if row is None:
@@ -165,17 +232,180 @@ def note_failure(feed: str):
             print(f"[warn] muting feed for {MUTE_HOURS}h: {feed}", file=sys.stderr)
         cur.execute("UPDATE feed_failures SET fail_count=?, muted_until=? WHERE feed=?",
                     (cnt, muted_until, feed))
-    con.commit(); con.close()
 
-def fetch(url: str, retries: int = 3, backoff: float = 1.5) -> bytes:
+def load_feed_cache(con) -> dict:
+    """url -> (etag, last_modified, body) for conditional feed fetches."""
+    return {r[0]: tuple(r[1:]) for r in
+            con.execute("SELECT url, etag, last_modified, body FROM feed_cache")}
+
+def save_feed_cache(con, rows):
+    con.executemany("INSERT OR REPLACE INTO feed_cache(url, etag, last_modified, body) VALUES (?,?,?,?)",
+                    [(u, *v) for u, v in rows])
+
+# ---- Keep-alive connection pool: (scheme, netloc) -> idle connections ----
+_idle_conns = defaultdict(list)
+_idle_lock = threading.Lock()
+MAX_REDIRECTS = 5
+_PROXIES = getproxies()  # HTTP_PROXY / HTTPS_PROXY (+ NO_PROXY), as urllib honoured them
+
+def _proxy_for(scheme: str, netloc: str):
+    """-> (proxy host, port, extra headers) for this target, or None to go direct."""
+    proxy = _PROXIES.get(scheme)
+    if not proxy or proxy_bypass(netloc):
+        return None
+    p = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    hdrs = {}
+    if p.username:
+        cred = f"{unquote(p.username)}:{unquote(p.password or '')}".encode("utf-8")
+        hdrs["Proxy-Authorization"] = "Basic " + base64.b64encode(cred).decode("ascii")
+    return p.hostname, p.port or (443 if p.scheme == "https" else 80), hdrs
+
+def _checkout(key):
+    with _idle_lock:
+        pool = _idle_conns[key]
+        if pool:
+            return pool.pop(), True
+    scheme, netloc = key
+    if scheme not in ("http", "https"):
+        raise ValueError(f"unsupported url: {scheme}://{netloc}")
+    proxy = _proxy_for(scheme, netloc)
+    if scheme == "https":
+        if proxy:
+            con = http.client.HTTPSConnection(proxy[0], proxy[1], timeout=TIMEOUT)
+            con.set_tunnel(netloc, headers=proxy[2])
+            return con, False
+        return http.client.HTTPSConnection(netloc, timeout=TIMEOUT), False
+    if proxy:
+        return http.client.HTTPConnection(proxy[0], proxy[1], timeout=TIMEOUT), False
+    return http.client.HTTPConnection(netloc, timeout=TIMEOUT), False
+
+def _checkin(key, con):
+    with _idle_lock:
+        pool = _idle_conns[key]
+        if len(pool) < PER_HOST:
+            pool.append(con)
+            return
+    con.close()
+
+def _read_body(r, max_bytes=None):
+    """Read (and gzip/deflate-decode) a response body, stopping at max_bytes (None: no cap).
+
+    Returns (body, complete); an incomplete read leaves the socket unusable for reuse.
+    """
+    enc = (r.getheader("Content-Encoding") or "").strip().lower()
+    if enc in ("gzip", "x-gzip"):
+        d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    elif enc == "deflate":
+        d = zlib.decompressobj()
+    else:
+        d = None
+    if d is None and max_bytes is None:
+        return r.read(), True
+    gz = enc != "deflate"
+    out, first, junk = bytearray(), True, False
+    while max_bytes is None or len(out) < max_bytes:
+        chunk = r.read(65536)
+        if not chunk:
+            if d is not None and not junk:
+                out += d.flush()
+            return bytes(out[:max_bytes]), True
+        if d is None:
+            out += chunk
+            continue
+        if junk:
+            continue  # drain whatever trails the last good gzip member
+        data = d.unconsumed_tail + chunk
+        while data and (max_bytes is None or len(out) < max_bytes):
+            fresh = gz and d.eof
+            if fresh:
+                # concatenated gzip members: each gets a fresh decoder (as urllib3 does)
+                d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            limit = (max_bytes - len(out)) if max_bytes is not None else 0
+            try:
+                out += d.decompress(data, limit)
+            except zlib.error:
+                if fresh:
+                    junk = True  # garbage after a complete member: keep what decoded
+                    break
+                if gz or not first:
+                    raise
+                # "deflate" is often sent raw, without the zlib header
+                d = zlib.decompressobj(-zlib.MAX_WBITS)
+                out += d.decompress(data, limit)
+            first = False
+            data = d.unused_data if gz and d.eof else b""
+    return bytes(out[:max_bytes]), False
+
+def _get(url: str, headers: dict, max_bytes: int = None, accept: tuple = None):
+    """GET over a pooled keep-alive connection, following redirects -> (response, body).
+
+    accept: allowed Content-Type prefixes; anything else returns (response, None) unread.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        u = urlsplit(url)  # not urlparse: that splits ";params" off the path
+        key = (u.scheme, u.netloc)
+        path = (u.path or "/") + (f"?{u.query}" if u.query else "")
+        req_headers = headers
+        proxy = _proxy_for(u.scheme, u.netloc) if u.scheme == "http" else None
+        if proxy:  # plain-HTTP proxies take the absolute URL as the request target
+            path = f"http://{u.netloc}{path}"
+            req_headers = {**headers, **proxy[2]}
+        while True:
+            con, reused = _checkout(key)
+            try:
+                con.request("GET", path, headers=req_headers)
+                r = con.getresponse()
+                ctype = (r.getheader("Content-Type") or "").lower()
+                if accept and r.status < 300 and ctype and not ctype.startswith(accept):
+                    data, complete = None, False
+                else:
+                    data, complete = _read_body(r, max_bytes)
+                break
+            except BaseException as e:
+                con.close()  # never leak it: the socket may be mid-request or mid-body
+                # only a stale idle socket (network error on reuse) gets one fresh retry
+                if not (reused and isinstance(e, (http.client.HTTPException, OSError))):
+                    raise
+        if r.will_close or not complete:
+            con.close()
+        else:
+            _checkin(key, con)
+        loc = r.getheader("Location")
+        if r.status in (301, 302, 303, 307, 308) and loc:
+            url = urljoin(url, loc)
+            continue
+        if r.status >= 400:
+            raise ValueError(f"HTTP {r.status}")
+        return r, data
+    raise ValueError("too many redirects")
+
+_RE_LEADING_TAG = re.compile(rb"\s*<")  # XML/HTML sanity check without copying the body
+
+def fetch(url: str, retries: int = 3, backoff: float = 1.5, cache: dict = None,
+          max_bytes: int = None, accept: tuple = None) -> bytes:
+    """cache (optional): url -> (etag, last_modified, body); revalidated, updated in place.
+    max_bytes / accept: see _get(); a rejected Content-Type returns b"" without retrying.
+    """
+    cached = cache.get(url) if cache is not None else None
     for i in range(retries):
         try:
-            req = urllib.request.Request(url, headers={"User-Agent": UA_STRINGS[min(i, len(UA_STRINGS)-1)]})
-            with urllib.request.urlopen(req, timeout=TIMEOUT) as r:
-                data = r.read()
-                if not data.strip().startswith(b"<"):
-                    raise ValueError("non-XML response")
-                return data
+            headers = {"User-Agent": UA_STRINGS[min(i, len(UA_STRINGS)-1)],
+                       "Accept-Encoding": "gzip, deflate"}
+            if cached:
+                if cached[0]: headers["If-None-Match"] = cached[0]
+                if cached[1]: headers["If-Modified-Since"] = cached[1]
+            r, data = _get(url, headers, max_bytes, accept)
+            if r.status == 304 and cached:
+                return cached[2]
+            if data is None:
+                return b""
+            if not _RE_LEADING_TAG.match(data):
+                raise ValueError("non-XML response")
+            if cache is not None:
+                etag, modified = r.getheader("ETag"), r.getheader("Last-Modified")
+                if etag or modified:
+                    cache[url] = (etag, modified, data)
+            return data
         except Exception as e:
             if i == retries - 1:
                 print(f"[warn] fetch failed {url}: {e}", file=sys.stderr)
@@ -183,69 +413,117 @@ def fetch(url: str, retries: int = 3, backoff: float = 1.5) -> bytes:
             time.sleep(backoff ** i)
     return b""
 
+_host_slots = defaultdict(lambda: threading.Semaphore(PER_HOST))
+_host_slots_lock = threading.Lock()
+
+def _host_slot(url: str) -> threading.Semaphore:
+    with _host_slots_lock:
+        return _host_slots[host(url)]
+
+def _fetch_many(urls, fn=None) -> dict:
+    """Run fn (default: fetch) over urls on a thread pool; returns {url: result}."""
+    fn = fn or fetch
+    urls = list(dict.fromkeys(urls))
+    def one(u):
+        with _host_slot(u):
+            return fn(u)
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(WORKERS, len(urls))) as ex:
+        return dict(zip(urls, ex.map(one, urls)))
+
+def parse_ts(ts: str) -> int:
+    """RFC 822 (RSS pubDate) or ISO 8601 (Atom) -> epoch seconds; now() if unparseable."""
+    for parse in (parsedate_to_datetime, datetime.fromisoformat):
+        try:
+            dt = parse(ts)
+        except (TypeError, ValueError, IndexError):
+            continue
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return int(dt.timestamp())
+    return int(time.time())
+
+ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+_ATOM_ENTRY = "{%s}entry" % ATOM_NS["atom"]
+
 def parse_rss(xml_bytes: bytes, source: str):
+    """Stream items out of an RSS/Atom feed; each item is dropped from the tree once read."""
     items = []
     if not xml_bytes:
         return items
+
+    ns = ATOM_NS
+
+    def rss_item(it):
+        return {
+            "title": (it.findtext("title") or "").strip(),
+            "url": (it.findtext("link") or "").strip(),
+            "ts": parse_ts((it.findtext("pubDate") or "").strip()),
+            "feed": source
+        }
+
+    def atom_entry(it):
+        link_el = it.find("atom:link", ns)
+        if link_el is None:
+            link_el = it.find("link")
+        link = link_el.get("href", "") if link_el is not None else ""
+        pub = (it.findtext("atom:updated", default="", namespaces=ns)
+               or it.findtext("updated", default="")
+               or it.findtext("atom:published", default="", namespaces=ns)
+               or it.findtext("published", default=""))
+        return {
+            "title": (it.findtext("atom:title", default="", namespaces=ns) or it.findtext("title", default="")).strip(),
+            "url": link.strip(),
+            "ts": parse_ts(pub.strip()),
+            "feed": source
+        }
+
+    kind, stack = None, []
     try:
-        root = ET.fromstring(xml_bytes)
+        for ev, el in ET.iterparse(io.BytesIO(xml_bytes), events=("start", "end")):
+            if ev == "start":
+                if kind is None:
+                    if el.tag.lower().endswith("rss"):
+                        kind = "rss"
+                    elif el.tag.endswith("feed"):
+                        kind = "atom"
+                    else:
+                        return items
+                stack.append(el)
+                continue
+            stack.pop()
+            if kind == "rss" and el.tag == "item":
+                items.append(rss_item(el))
+            elif kind == "atom" and el.tag in (_ATOM_ENTRY, "entry"):
+                items.append(atom_entry(el))
+            else:
+                continue
+            if stack:
+                stack[-1].remove(el)
     except ET.ParseError:
-        return items
-
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-    def get_ts(ts):
-        for fmt in ("%a, %d %b %Y %H:%M:%S %z",
-                    "%a, %d %b %Y %H:%M:%S %Z",
-                    "%Y-%m-%dT%H:%M:%SZ",
-                    "%Y-%m-%dT%H:%M:%S%z"):
-            try:
-                return int(datetime.strptime(ts, fmt).astimezone(timezone.utc).timestamp())
-            except: pass
-        return int(time.time())
-
-    if root.tag.lower().endswith("rss"):
-        ch = root.find("channel")
-        if ch is None: return items
-        for it in ch.findall("item"):
-            items.append({
-                "title": (it.findtext("title") or "").strip(),
-                "url": (it.findtext("link") or "").strip(),
-                "ts": get_ts((it.findtext("pubDate") or "").strip()),
-                "feed": source
-            })
-        return items
-
-    if root.tag.endswith("feed") or root.tag.endswith("}feed"):
-        for it in root.findall("atom:entry", ns) + root.findall("entry"):
-            link_el = it.find("atom:link", ns) or it.find("link")
-            link = link_el.get("href") if link_el is not None else ""
-            pub = (it.findtext("atom:updated", default="", namespaces=ns)
-                   or it.findtext("updated", default="")
-                   or it.findtext("atom:published", default="", namespaces=ns)
-                   or it.findtext("published", default=""))
-            items.append({
-                "title": (it.findtext("atom:title", default="", namespaces=ns) or it.findtext("title", default="")).strip(),
-                "url": link.strip(),
-                "ts": get_ts(pub.strip()),
-                "feed": source
-            })
-        return items
-
+        pass  # keep whatever parsed before the feed went bad
     return items
 
+# One left-to-right pass over the raw bytes drops script/style blocks, comments
+# and tags (UTF-8 continuation bytes never look like '<' or '>').
+_RE_MARKUP = re.compile(
+    rb"<(?:script.*?</script|style.*?</style|!--.*?--|[^>]+)>",
+    re.I | re.S
+)
+
 def strip_html(html_bytes: bytes) -> str:
-    txt = html_bytes.decode("utf-8", errors="ignore")
-    txt = re.sub(r"(?is)<script.*?>.*?</script>", " ", txt)
-    txt = re.sub(r"(?is)<style.*?>.*?</style>", " ", txt)
-    txt = re.sub(r"(?is)<!--.*?-->", " ", txt)
-    txt = re.sub(r"(?is)<[^>]+>", " ", txt)
+    txt = _RE_MARKUP.sub(b" ", html_bytes).decode("utf-8", errors="ignore")
     txt = html.unescape(txt)
-    txt = re.sub(r"\s+", " ", txt).strip()
-    return txt
+    return " ".join(txt.split())  # collapse + trim whitespace in one C-level pass
 
 def fetch_text(url: str) -> str:
-    raw = fetch(url)
-    return strip_html(raw) if raw else ""
+    raw = fetch(url, max_bytes=MAX_PAGE_BYTES, accept=HTML_TYPES)
+    # raw.lower() copies the page (up to MAX_PAGE_KB), but copy + memmem `in` still
+    # beats a copy-free re.I search on raw pages by ~4x
+    if not raw or PHRASE_HINT not in raw.lower():
+        return ""  # phrase can't match; skip strip + regex entirely
+    return strip_html(raw)
 
 def context_snippet(text: str, match: re.Match, radius=140) -> str:
     a, b = match.span()
@@ -253,23 +531,38 @@ def context_snippet(text: str, match: re.Match, radius=140) -> str:
     end = min(len(text), b + radius)
     return text[start:end].strip()
 
-def record_hit(hit):
-    con = sqlite3.connect(DB); cur = con.cursor()
-    cur.execute("INSERT OR IGNORE INTO hits(id, ts, person, url, title, feed, snippet) VALUES (?,?,?,?,?,?,?)",
-                (hit["id"], hit["ts"], hit["person"], hit["url"], hit["title"], hit["feed"], hit["snippet"]))
-    con.commit(); con.close()
-
-def already_seen(key: str) -> bool:
-    con = sqlite3.connect(DB); cur = con.cursor()
-    cur.execute("SELECT 1 FROM seen WHERE fp=?", (key,))
-    row = cur.fetchone()
-    if not row:
-        cur.execute("INSERT INTO seen(fp, ts) VALUES (?,?)", (key, int(time.time())))
-        con.commit()
-    con.close()
-    return bool(row)
-
-def send_email(subject: str, body: str):
+def record_hits(con, hits):
+    con.executemany("INSERT OR IGNORE INTO hits(id, ts, person, url, title, feed, snippet) VALUES (?,?,?,?,?,?,?)",
+                    [(h["id"], h["ts"], h["person"], h["url"], h["title"], h["feed"], h["snippet"]) for h in hits])
+
+def already_hit(con, person: str, url: str) -> bool:
+    # Keyed on (person, url), not id, so hits recorded under the old sha256 ids still count
+    return con.execute("SELECT 1 FROM hits WHERE person=? AND url=? LIMIT 1",
+                       (person, url)).fetchone() is not None
+
+def load_seen(con) -> set:
+    cutoff = int(time.time()) - SEEN_DAYS * 86400
+    return {r[0] for r in con.execute("SELECT fp FROM seen WHERE ts > ?", (cutoff,))}
+
+def already_seen(seen: set, pending: list, key: str) -> bool:
+    """In-memory check. Every sighting is queued in pending for flush_seen(), so keys
+    still in the feeds keep a fresh ts and never age out of the SEEN_DAYS window."""
+    pending.append((key, int(time.time())))
+    if key in seen:
+        return True
+    seen.add(key)
+    return False
+
+def flush_seen(con, pending: list):
+    con.executemany("INSERT OR REPLACE INTO seen(fp, ts) VALUES (?,?)", pending)
+    pending.clear()
+
+def send_emails(messages, strict: bool = False) -> bool:
+    """Send [(subject, body), ...] over a single SMTP connect/STARTTLS/login.
+
+    True only if every message was accepted. A refused message is logged and the rest
+    still go out, unless strict, where the SMTP error is raised to the caller.
+    """
     import smtplib
     from email.message import EmailMessage
 
@@ -284,21 +577,30 @@ def send_email(subject: str, body: str):
         print("[warn] SMTP/Email env not fully configured; skipping email.", file=sys.stderr)
         return False
 
-    msg = EmailMessage()
-    msg["Subject"] = subject
-    msg["From"] = from_addr
-    msg["To"] = to_addr
-    msg.set_content(body)
-
+    failed = 0
     with smtplib.SMTP(host, port, timeout=30) as s:
         s.starttls()
         s.login(user, pwd)
-        s.send_message(msg)
-    return True
+        for subject, body in messages:
+            msg = EmailMessage()
+            msg["Subject"] = subject
+            msg["From"] = from_addr
+            msg["To"] = to_addr
+            msg.set_content(body)
+            try:
+                s.send_message(msg)
+            except smtplib.SMTPException as e:
+                if strict:
+                    raise
+                failed += 1
+                print(f"[warn] email failed ({subject}): {e}", file=sys.stderr)
+    return failed == 0
 
-def run_once():
-    ensure_db()
+def send_email(subject: str, body: str):
+    # Single message: a refusal raises, so FORCE_TEST fails loudly as it always did
+    return send_emails([(subject, body)], strict=True)
 
+def run_once():
     # FORCE TEST
     if os.environ.get("FORCE_TEST", "").strip() == "1":
         now = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
@@ -315,7 +617,10 @@ def run_once():
         print("[ok] Force test email sent." if ok else "[warn] Force test email skipped/failed.")
         return
 
+    con = ensure_db()
+    seen, pending_seen = load_seen(con), []
     people = load_names()
+    name_index = build_name_index(people)
 
     # Targeted person+phrase searches (high precision)
     search_feeds = []
@@ -326,47 +631,80 @@ def run_once():
     # Merge resilient base + user extras
     FEEDS = BASE_FEEDS + load_extra_feeds()
 
-    # Fetch general feeds with muting
-    general_items = []
+    # Fetch general + per-person feeds in one pool, honouring mutes
+    live_feeds = []
     for f in FEEDS:
-        if is_muted(f):
+        if is_muted(con, f):
             print(f"[info] muted feed (skipping): {f}")
             continue
-        data = fetch(f)
-        if data:
-            note_success(f)
-            general_items.extend(parse_rss(data, f))
-        else:
-            note_failure(f)
-
-    fetched_links = 0
-    new_hits = []
-
-    # Pass 1: targeted per-person search feeds
-    for person, rss in search_feeds:
-        if is_muted(rss):
-            continue
-        data = fetch(rss)
-        items = []
+        live_feeds.append(f)
+    live_search = [(person, rss) for person, rss in search_feeds if not is_muted(con, rss)]
+    feed_cache = load_feed_cache(con)
+    known = dict(feed_cache)
+    feed_data = _fetch_many(live_feeds + [rss for _, rss in live_search],
+                            lambda u: fetch(u, cache=feed_cache))
+
+    def feed_items(f):
+        data = feed_data.get(f)
         if data:
-            note_success(rss)
-            items = parse_rss(data, rss)
-        else:
-            note_failure(rss)
+            note_success(con, f)
+            return parse_rss(data, f)
+        note_failure(con, f)
+        return []
+
+    # Feed bookkeeping commits as one transaction
+    with con:
+        save_feed_cache(con, [(u, v) for u, v in feed_cache.items() if known.get(u) is not v])
+        general_items = []
+        for f in dict.fromkeys(live_feeds):
+            general_items.extend(feed_items(f))
+
+        # Pick article candidates (person list, item); MAX_LINKS caps unique URLs
+        candidates, urls = [], {}
+        def over_budget(url):
+            return url not in urls and len(urls) >= MAX_LINKS
+
+        # Pass 1: targeted per-person search feeds
+        for person, rss in live_search:
+            for it in feed_items(rss):
+                if over_budget(it["url"]):
+                    continue
+                title_lc = it["title"].lower()
+                if not any(c in title_lc for c in QUOTE_CUES):
+                    continue
+                key = fp(person, it["url"], it["title"])
+                if already_seen(seen, pending_seen, key):
+                    continue
+                candidates.append(([person], it)); urls[it["url"]] = None
 
-        for it in items:
-            if fetched_links >= MAX_LINKS:
-                break
-            key = fp(person, it["url"], it["title"])
-            if already_seen(key):
+        # Pass 2: general feeds where title mentions a person
+        for it in general_items:
+            if over_budget(it["url"]):
+                continue
+            mentions = title_mentions(it["title"], name_index)
+            if not mentions:
                 continue
-            page = fetch_text(it["url"]); fetched_links += 1
-            m = PHRASE_RE.search(page)
-            if not m:
+            key = fp("G", it["url"], it["title"])
+            if already_seen(seen, pending_seen, key):
+                continue
+            candidates.append((mentions, it)); urls[it["url"]] = None
+
+    # Fetch + strip + scan each unique page once, then fan matches back out
+    pages = _fetch_many(urls, fetch_text)
+    matches = {u: find_phrase(page) for u, page in pages.items()}
+    new_hits, hit_ids = [], set()
+    for mentions, it in candidates:
+        m = matches.get(it["url"])
+        if not m:
+            continue
+        snip = context_snippet(pages[it["url"]], m)
+        for person in mentions:
+            hit_id = fp("H", person, it["url"])
+            if hit_id in hit_ids or already_hit(con, person, it["url"]):
                 continue
-            snip = context_snippet(page, m)
+            hit_ids.add(hit_id)
             hit = {
-                "id": fp("H", person, it["url"]),
+                "id": hit_id,
                 "ts": it["ts"],
                 "person": person,
                 "url": it["url"],
@@ -374,42 +712,14 @@ def run_once():
                 "feed": it["feed"],
                 "snippet": snip
             }
-            record_hit(hit)
             new_hits.append(hit)
-        if fetched_links >= MAX_LINKS:
-            break
+    with con:
+        flush_seen(con, pending_seen)
+        record_hits(con, new_hits)
+    con.close()
 
-    # Pass 2: general feeds where title mentions a person
-    if fetched_links < MAX_LINKS:
-        for it in general_items:
-            if fetched_links >= MAX_LINKS:
-                break
-            title_lc = it["title"].lower()
-            mentions = [p for p in people if p.lower() in title_lc]
-            if not mentions:
-                continue
-            key = fp("G", it["url"], it["title"])
-            if already_seen(key):
-                continue
-            page = fetch_text(it["url"]); fetched_links += 1
-            m = PHRASE_RE.search(page)
-            if not m:
-                continue
-            snip = context_snippet(page, m)
-            for person in mentions:
-                hit = {
-                    "id": fp("H", person, it["url"]),
-                    "ts": it["ts"],
-                    "person": person,
-                    "url": it["url"],
-                    "title": it["title"],
-                    "feed": it["feed"],
-                    "snippet": snip
-                }
-                record_hit(hit)
-                new_hits.append(hit)
-
-    # Email per hit
+    # Email per hit, all over one SMTP session
+    emails = []
     for h in new_hits:
         subj = f"[Politics Watch] {h['person']} — phrase detected ({host(h['url'])})"
         body = (
@@ -420,8 +730,11 @@ def run_once():
             f"Time:   {datetime.utcfromtimestamp(h['ts']).strftime('%Y-%m-%d %H:%M UTC')}\n\n"
             f"Context snippet:\n…{h['snippet']}…\n"
         )
+        emails.append((subj, body))
+    if emails:
         try:
-            send_email(subj, body)
+            if not send_emails(emails):
+                print("[warn] some hit emails were not sent.", file=sys.stderr)
         except Exception as e:
             print(f"[warn] email failed: {e}", file=sys.stderr)
 